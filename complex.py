@@ -1,11 +1,14 @@
 from __future__ import annotations
 from typing import Tuple, Union, List
-from math import atan2, cos, sin, pow, sqrt, pi
+from math import atan2, cos, sin, pow, hypot, pi
+import numpy as np
 
 """ Implementation of complex numbers (we don't want to use j, only i) """
 
 
 class Complex:
+    __slots__ = ('re', 'im', '_r', '_phase')
+
     def __init__(self, re: Union[int, float], im: Union[int, float] = 0):
         """
         Create a complex number
@@ -14,8 +17,41 @@ class Complex:
         """
         self.re = float(re)
         self.im = float(im)
-        self.r = sqrt(pow(self.re, 2) + pow(self.im, 2))
-        self.phase = atan2(self.im, self.re) if self.re != 0 else (pi / 2 if self.im > 0 else 3*pi / 2)
+        self._r = None
+        self._phase = None
+
+    @staticmethod
+    def _make(re: float, im: float) -> Complex:
+        """
+        Create a complex number from already-float parts without going through __init__
+        :param re: real part
+        :param im: imaginary part
+        :return: a complex number instance
+        """
+        z = object.__new__(Complex)
+        z.re = re
+        z.im = im
+        z._r = None
+        z._phase = None
+        return z
+
+    @property
+    def r(self) -> float:
+        """
+        :return: the magnitude of the complex number (computed on first access)
+        """
+        if self._r is None:
+            self._r = hypot(self.re, self.im)
+        return self._r
+
+    @property
+    def phase(self) -> float:
+        """
+        :return: the angle θ of the complex number (computed on first access)
+        """
+        if self._phase is None:
+            self._phase = atan2(self.im, self.re)
+        return self._phase
 
     @classmethod
     def from_polar(cls, r: float, theta: float) -> Complex:
@@ -25,7 +61,12 @@ class Complex:
         :param theta: angle θ of the vector
         :return: a complex number instance
         """
-        return cls(r * cos(theta), r * sin(theta))
+        z = Complex._make(r * cos(theta), r * sin(theta))
+        # keep the known polar form when it is already the canonical one, so it isn't recomputed
+        if r > 0 and -pi < theta <= pi:
+            z._r = float(r)
+            z._phase = float(theta)
+        return z
 
     def polar(self) -> Tuple[float, float]:
         """
@@ -45,7 +86,7 @@ class Complex:
         """
         :return: the complex conjugate (a + bi) -> (a - bi)
         """
-        return Complex(self.re, -self.im)
+        return Complex._make(self.re, -self.im)
 
     def __add__(self, other: Union[int, float, Complex]) -> Complex:
         """
@@ -54,9 +95,9 @@ class Complex:
         :return: the sum
         """
         if isinstance(other, Complex):
-            return Complex(self.re + other.re, self.im + other.im)
+            return Complex._make(self.re + other.re, self.im + other.im)
         elif isinstance(other, (int, float)):
-            return Complex(self.re + other, self.im)
+            return Complex._make(self.re + other, self.im)
         else:
             raise NotImplementedError
 
@@ -68,26 +109,29 @@ class Complex:
         """
         return self.__add__(other)
 
-    def __sub__(self, other: Union[int, float, Complex]):
+    def __sub__(self, other: Union[int, float, Complex]) -> Complex:
         """
         Complex - Complex or Complex - int/float
         :param other: Complex / int / float
-        :return: the sum
+        :return: the difference
         """
         if isinstance(other, Complex):
-            return Complex(self.re - other.re, self.im - other.im)
+            return Complex._make(self.re - other.re, self.im - other.im)
         elif isinstance(other, (int, float)):
-            return Complex(self.re - other, self.im)
+            return Complex._make(self.re - other, self.im)
         else:
             raise NotImplementedError
 
-    def __rsub__(self, other: Union[int, float]):
+    def __rsub__(self, other: Union[int, float]) -> Complex:
         """
         int/float - Complex
         :param other: int / float
-        :return: the sum
+        :return: the difference
         """
-        self.__sub__(other)
+        if isinstance(other, (int, float)):
+            return Complex._make(other - self.re, -self.im)
+        else:
+            raise NotImplementedError
 
     def __mul__(self, other: Union[int, float, Complex]) -> Complex:
         """
@@ -96,11 +140,17 @@ class Complex:
         :return: the product
         """
         if isinstance(other, Complex):
+            # real operands: skip the cross terms that are known to vanish
+            if other.im == 0.0:
+                return Complex._make(self.re * other.re, self.im * other.re)
+            if self.im == 0.0:
+                return Complex._make(self.re * other.re, self.re * other.im)
+
             real_part = self.re * other.re - self.im * other.im
             imag_part = self.re * other.im + self.im * other.re
-            return Complex(real_part, imag_part)
+            return Complex._make(real_part, imag_part)
         elif isinstance(other, (int, float)):
-            return Complex(self.re * other, self.im * other)
+            return Complex._make(self.re * other, self.im * other)
         else:
             raise NotImplementedError
 
@@ -124,17 +174,24 @@ class Complex:
         :return: the fraction
         """
         if isinstance(other, Complex):
-            if other == Complex(0, 0):
+            # real divisor: plain componentwise division
+            if other.im == 0.0:
+                if other.re == 0.0:
+                    raise ZeroDivisionError
+                return Complex._make(self.re / other.re, self.im / other.re)
+
+            denom = other.re * other.re + other.im * other.im
+            if denom == 0.0:
                 raise ZeroDivisionError
 
-            real_part = (self.re * other.re + self.im * other.im) / (other.__abs__() ** 2)
-            imag_part = (self.im * other.re - self.re * other.im) / (other.__abs__() ** 2)
-            return Complex(real_part, imag_part)
+            real_part = (self.re * other.re + self.im * other.im) / denom
+            imag_part = (self.im * other.re - self.re * other.im) / denom
+            return Complex._make(real_part, imag_part)
         elif isinstance(other, (int, float)):
             if other == 0:
                 raise ZeroDivisionError
 
-            return Complex(self.re / other, self.im / other)
+            return Complex._make(self.re / other, self.im / other)
         else:
             raise NotImplementedError
 
@@ -145,8 +202,11 @@ class Complex:
         :return: the fraction
         """
         if isinstance(other, (int, float)):
-            denom = self.__abs__() ** 2
-            return self.conjugate().__truediv__(denom)
+            denom = self.re * self.re + self.im * self.im
+            if denom == 0.0:
+                raise ZeroDivisionError
+
+            return Complex._make(other * self.re / denom, -other * self.im / denom)
         else:
             raise NotImplementedError
 
@@ -181,7 +241,7 @@ class Complex:
         """
         :return: the negated complex number (a+bi) -> (-a-bi)
         """
-        return Complex(-self.re, -self.im)
+        return Complex._make(-self.re, -self.im)
 
     def __str__(self):
         sign = '' if self.im < 0 else '+'
@@ -196,11 +256,15 @@ class Complex:
         return f'{self.re}{sign}{self.im}i'
 
     def __hash__(self):
-        return self.__repr__().__hash__()
+        # consistent with __eq__ against int/float: a real Complex hashes like its real part
+        if self.im == 0:
+            return hash(self.re)
+        return hash((self.re, self.im))
 
     def roots(self, degree) -> List[Complex]:
         r = pow(self.r, 1 / degree)
-        return [Complex.from_polar(r, (self.phase + 2*pi*i) / degree) for i in range(degree)]
+        theta = (self.phase + 2*pi*np.arange(degree)) / degree
+        return [Complex._make(re, im) for re, im in zip((r * np.cos(theta)).tolist(), (r * np.sin(theta)).tolist())]
 
     def principal_root(self, degree) -> Complex:
         return Complex.from_polar(pow(self.r, 1 / degree), self.phase / degree + 2 * pi)
@@ -1,29 +1,73 @@
 from __future__ import annotations
 from typing import List, Union
+from collections import Counter
 import numpy as np
 import math
-from complex import Complex
 from scipy.signal import fftconvolve
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _poly_divmod_kernel(dividend, divisor):
+    n = len(dividend)
+    m = len(divisor)
+    if n < m:
+        return np.zeros(1, dtype=np.complex128), dividend.copy()
+
+    remainder = dividend.copy()
+    quotient = np.empty(n - m + 1, dtype=np.complex128)
+    for i in range(n - m + 1):
+        leading_coefficient = remainder[i] / divisor[0]
+        quotient[i] = leading_coefficient
+        remainder[i:i + m] -= leading_coefficient * divisor
+
+    if m == 1:
+        return quotient, np.zeros(1, dtype=np.complex128)
+    return quotient, remainder[n - m + 1:]
 
 
 class Polynomial:
-    def __init__(self, coefficients: List[Union[int, float]]):
+    __slots__ = ('coef', 'degree', '_roots')
+
+    def __init__(self, coefficients: Union[List[Union[int, float]], np.ndarray]):
         self.coef = np.array(coefficients)
+        if not np.iscomplexobj(self.coef):
+            self.coef = self.coef.astype(np.float64, copy=False)
         self.degree = len(coefficients)-1 if len(coefficients) != 0 else -math.inf
-
-        roots = [Complex(r.real, r.imag) for r in np.roots(self.coef).tolist()]
-        self.roots = {r: roots.count(r) for r in set(roots)}
+        self._roots = None
+
+    @staticmethod
+    def _make(coef: np.ndarray) -> Polynomial:
+        """
+        Wrap a freshly computed float64/complex128 coefficient array without copying it
+        :param coef: coefficients array owned by no one else
+        :return: a polynomial instance
+        """
+        p = object.__new__(Polynomial)
+        p.coef = coef
+        p.degree = len(coef)-1 if len(coef) != 0 else -math.inf
+        p._roots = None
+        return p
+
+    @property
+    def roots(self) -> Counter:
+        """
+        :return: the roots of the polynomial mapped to their multiplicity (computed on first access)
+        """
+        if self._roots is None:
+            self._roots = Counter(np.roots(self.coef).astype(np.complex128).tolist())
+        return self._roots
 
     def coefficients(self):
         return self.coef.tolist()
 
     def __add__(self, other: Union[Polynomial, int, float]) -> Polynomial:
         if isinstance(other, Polynomial):
-            return Polynomial((self.coef + other.coef).tolist())
+            return Polynomial._make(self.coef + other.coef)
         elif isinstance(other, (int, float)):
-            temp = self.coefficients()
+            temp = self.coef.copy()
             temp[0] += other
-            return Polynomial(temp)
+            return Polynomial._make(temp)
         else:
             raise NotImplementedError
 
@@ -31,16 +75,16 @@ class Polynomial:
 
     def __sub__(self, other: Union[Polynomial, int, float]) -> Polynomial:
         if isinstance(other, Polynomial):
-            return Polynomial((self.coef - other.coef).tolist())
+            return Polynomial._make(self.coef - other.coef)
         elif isinstance(other, (int, float)):
-            temp = self.coefficients()
+            temp = self.coef.copy()
             temp[0] -= other
-            return Polynomial(temp)
+            return Polynomial._make(temp)
         else:
             raise NotImplementedError
 
     def __neg__(self):
-        return Polynomial(-self.coefficients())
+        return Polynomial._make(-self.coef)
 
     def __rsub__(self, other: Union[int, float]):
         return self.__neg__() + other
@@ -52,7 +96,7 @@ class Polynomial:
             if c == 0:
                 continue
             sign = '+ ' if c > 0 else '- '
-            coef = '' if abs(c) == 1 and i != 0 else f'{abs(c)}'
+            coef = '' if abs(c) == 1 and i != 0 else (f'{abs(c):.0f}' if float(c).is_integer() else f'{abs(c)}')
 
             if i == 0:
                 coef = '-' + coef if c < 0 else coef
@@ -66,57 +110,54 @@ class Polynomial:
         return ' '.join(pieces)
 
     def __mul__(self, other: Polynomial):
-        return Polynomial(fftconvolve(self.coefficients(), other.coefficients()).tolist())
+        # direct convolution beats the FFT setup cost for small polynomials
+        if len(self.coef) * len(other.coef) < 2048:
+            return Polynomial._make(np.convolve(self.coef, other.coef))
+        return Polynomial._make(fftconvolve(self.coef, other.coef))
 
     __rmul__ = __mul__
 
     def __truediv__(self, other: Union[int, float]):
         if not other:
             raise ZeroDivisionError
-        return Polynomial((self.coef / other).tolist())
+        return Polynomial._make(self.coef / other)
 
     def div(self, other: Polynomial):
         if len(set(other.coefficients())) == 1 and 0 in other.coefficients():
             raise ZeroDivisionError
-        p1 = self.roots
-        p2 = other.roots
+        p1 = Counter(self.roots)
+        p2 = Counter(other.roots)
 
         # remove similar roots if there are any
-        if len(set(self.coefficients()) - set(other.coefficients())) != 0:
-            for k in self.roots.keys():
-                if k not in p2.keys():
-                    continue
-                p1[k] -= min(p2[k], p1[k])
+        for k in p1.keys() & p2.keys():
+            common = min(p2[k], p1[k])
+            p1[k] -= common
+            p2[k] -= common
 
         # polynomial division
-        dividend = self.polynomial_from_roots(list(np.array([[r] * t for r, t in p1.items()]).flatten()))
-        divisor = self.polynomial_from_roots(list(np.array([[r] * t for r, t in p2.items()]).flatten()))
-
-        quotient = []
-        remainder = dividend[:]  # Copy dividend to remainder
-
-        degree_dividend = len(dividend) - 1
-        degree_divisor = len(divisor) - 1
-
-        if degree_dividend < degree_divisor:
-            return [0], dividend
-
-        while degree_dividend >= degree_divisor:
-            leading_coefficient = remainder[0] / divisor[0]
-            quotient.append(leading_coefficient)
-            remainder = [remainder[i] - leading_coefficient * divisor[i] for i in range(len(divisor))] + remainder[
-                                                                                                 len(divisor):]
-            while len(remainder) > 1 and remainder[0] == 0:
-                remainder = remainder[1:]
-            degree_dividend = len(remainder) - 1
+        dividend = self.polynomial_from_roots(np.repeat(np.fromiter(p1.keys(), dtype=np.complex128, count=len(p1)),
+                                                        np.fromiter(p1.values(), dtype=np.intp, count=len(p1))))
+        divisor = self.polynomial_from_roots(np.repeat(np.fromiter(p2.keys(), dtype=np.complex128, count=len(p2)),
+                                                       np.fromiter(p2.values(), dtype=np.intp, count=len(p2))))
+
+        quotient, remainder = _poly_divmod_kernel(np.asarray(dividend, dtype=np.complex128),
+                                                  np.asarray(divisor, dtype=np.complex128))
+
+        # trim leading (numerically) zero coefficients of the remainder, keeping at least one
+        nonzero = np.abs(remainder) > 1e-12
+        remainder = remainder[np.argmax(nonzero):] if nonzero.any() else remainder[-1:]
         return quotient, remainder
 
     @classmethod
     def polynomial_from_roots(cls, roots):
-        coeffs = [1]
+        # build every factor in the roots' working dtype (complex128 from div) so no step re-casts
+        roots = np.asarray(roots)
+        dtype = np.result_type(roots.dtype, np.float64)
+
+        coeffs = np.ones(1, dtype=dtype)
         for root in roots:
-            coeffs = np.convolve(coeffs, [1, -root])
-        return coeffs.tolist()
+            coeffs = np.convolve(coeffs, np.array([1, -root], dtype=dtype))
+        return coeffs
 
 
 if __name__ == '__main__':
@@ -124,3 +165,7 @@ if __name__ == '__main__':
     p2 = Polynomial([1, 1])
     print(p1)
     print(p1.div(p2))
+
+    # rebuilding from many widely spread real roots must match numpy's reference
+    roots = np.arange(1, 41.)
+    assert np.allclose(Polynomial.polynomial_from_roots(roots), np.poly(roots), rtol=1e-12, atol=0)